@@ -2,15 +2,30 @@
 """
 Rclone Mount Manager - A utility to manage mounting and unmounting of rclone drives
 """
+import atexit
+import ctypes
+import json
 import os
+import re
+import signal
+import socket
 import subprocess
 import sys
 import threading
 import time
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Platform-specific keyboard input
+if os.name == 'nt':
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
 
 # Import Rich library components for better UI
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
@@ -21,70 +36,174 @@ from rich.live import Live
 # Initialize Rich console
 console = Console()
 
+# How long (in seconds) the list of rclone remotes is reused before re-running rclone
+REMOTES_CACHE_TTL = 30
+
+# How often (in seconds) the drive monitor checks whether rclone is still running
+MONITOR_POLL_INTERVAL = 1.0
+
+# How many times (one second apart) to try priming the directory cache of a new mount
+PRIME_CACHE_ATTEMPTS = 10
+
+# Flags passed to every "rclone mount", tuned for browsing a cloud drive in a file manager
+MOUNT_FLAGS = (
+    "--vfs-cache-mode", "full",
+    "--vfs-cache-max-size", "10G",
+    "--vfs-cache-max-age", "24h",
+    "--vfs-read-ahead", "128M",
+    "--vfs-read-chunk-size", "32M",
+    "--vfs-read-chunk-size-limit", "1G",
+    "--buffer-size", "16M",
+    "--dir-cache-time", "72h",
+    "--attr-timeout", "1h",
+    "--poll-interval", "15s",
+    "--no-modtime",
+    "--timeout", "1m",
+    "--log-level", "NOTICE",
+)
+
+# rclone flushes its VFS cache and unmounts cleanly when it receives this signal
+STOP_SIGNAL = signal.CTRL_BREAK_EVENT if os.name == 'nt' else signal.SIGINT
+
+# How long (in seconds) to wait for rclone to exit after STOP_SIGNAL, and then after terminate()
+GRACEFUL_STOP_TIMEOUT = 10
+TERMINATE_TIMEOUT = 5
+
+# Information about a drive mounted by this program
+@dataclass(slots=True)
+class MountInfo:
+    # None when the drive was already mounted by an rclone process we didn't start
+    process: Optional[subprocess.Popen]
+    mount_point: str
+    rc_addr: str
+    started_at: float = field(default_factory=time.monotonic)
+    # Last line rclone logged for this mount
+    log_tail: str = ""
+
+    def process_exited(self) -> bool:
+        """Check whether the rclone process we started for this mount has stopped"""
+        return self.process is not None and self.process.poll() is not None
+
 # Define class for managing rclone operations
 class RcloneMountManager:
     def __init__(self):
-        self.mounted_drives: Dict[str, Dict] = {}
+        self.mounted_drives: Dict[str, MountInfo] = {}
         self.mounting_process = None
         self.mount_thread = None
         self.running = True
         self.current_mount_name = None
+        self._remotes_cache: Optional[Tuple[float, Optional[float], Dict[str, Dict[str, str]]]] = None
+
+    def _get_rclone_config_path(self) -> str:
+        """Get the path of the rclone config file"""
+        if os.environ.get("RCLONE_CONFIG"):
+            return os.environ["RCLONE_CONFIG"]
+        if os.name == 'nt' and os.environ.get("APPDATA"):
+            return os.path.join(os.environ["APPDATA"], "rclone", "rclone.conf")
+        return os.path.expanduser("~/.config/rclone/rclone.conf")
+
+    def _get_rclone_config_mtime(self) -> Optional[float]:
+        """Get the modification time of the rclone config file, if it exists"""
+        try:
+            return os.stat(self._get_rclone_config_path()).st_mtime
+        except OSError:
+            return None
 
     def get_rclone_remotes(self) -> List[str]:
         """Get list of configured rclone remotes"""
+        return list(self.get_rclone_remotes_with_meta())
+
+    def get_rclone_remotes_with_meta(self) -> Dict[str, Dict[str, str]]:
+        """
+        Get the configured rclone remotes (with the trailing colon rclone expects)
+        mapped to their metadata, e.g. {"gdrive:": {"type": "drive"}}
+        """
+        # Reuse the last result while it is fresh and the config file is unchanged
+        config_mtime = self._get_rclone_config_mtime()
+        if self._remotes_cache is not None:
+            cached_at, cached_mtime, cached_remotes = self._remotes_cache
+            if time.monotonic() - cached_at < REMOTES_CACHE_TTL and cached_mtime == config_mtime:
+                return dict(cached_remotes)
+
         try:
+            # One call returns every remote with its full config
             result = subprocess.run(
-                ["rclone", "listremotes"], 
+                ["rclone", "config", "dump"], 
                 capture_output=True, 
                 text=True,
                 check=True
             )
-            # Remove the colon at the end of each remote name
-            remotes = [remote.strip() for remote in result.stdout.splitlines()]
-            return remotes
-        except subprocess.CalledProcessError:
+            config = json.loads(result.stdout or "{}")
+            # Only keep non-secret metadata, the dump also contains credentials
+            remotes = {
+                f"{name}:": {"type": remote_config.get("type", "")}
+                for name, remote_config in config.items()
+            }
+            self._remotes_cache = (time.monotonic(), config_mtime, remotes)
+            return dict(remotes)
+        except (subprocess.CalledProcessError, json.JSONDecodeError):
             console.print("[bold red]Error retrieving rclone remotes. Is rclone installed?[/bold red]")
-            return []
+            return {}
         except FileNotFoundError:
             console.print("[bold red]Error: rclone command not found. Please install rclone first.[/bold red]")
-            return []
+            return {}
 
-    def mount_drive(self, remote: str, mount_point: str) -> bool:
+    def mount_drive(self, remote: str, mount_point: str, extra_flags: Optional[List[str]] = None) -> bool:
         """
-        Mount a remote drive using rclone with the specified parameters
+        Mount a remote drive using rclone with MOUNT_FLAGS plus any extra flags
         """
         try:
+            # Reuse a live rclone mount (e.g. left over from a previous session) instead of starting another
+            if self._detect_existing_mount(remote, mount_point):
+                console.print(f"[yellow]{mount_point} is already mounted by rclone, reusing it.[/yellow]")
+                self.mounted_drives[remote] = MountInfo(None, mount_point, "")
+                return True
+            
             # Stop any previous mount process
             self.stop_current_mount()
             
+            # Each mount gets its own remote control port so concurrent mounts don't clash
+            rc_addr = f"127.0.0.1:{self._find_free_port()}"
+            
             # Prepare mounting command
             mount_cmd = [
                 "rclone", "mount", 
                 remote, mount_point,
-                "--vfs-cache-mode", "full", 
-                "--vfs-cache-max-size", "10G", 
-                "--vfs-cache-max-age", "1h", 
-                "--buffer-size", "64M", 
-                "--dir-cache-time", "72h", 
-                "--poll-interval", "15s", 
-                "--timeout", "1m", 
-                "--log-level", "INFO"
+                *MOUNT_FLAGS,
+                "--rc", f"--rc-addr={rc_addr}"
             ]
+            mount_cmd += extra_flags or []
             
             # Start the mount process
             self.current_mount_name = remote
             self.mounting_process = subprocess.Popen(
                 mount_cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True
+                # rclone logs in UTF-8 whatever the locale, and a bad byte must not kill the drain thread
+                encoding="utf-8",
+                errors="replace",
+                # A separate process group lets us send CTRL_BREAK_EVENT to rclone alone
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
             )
             
             # Store mount information
-            self.mounted_drives[remote] = {
-                "mount_point": mount_point,
-                "process": self.mounting_process
-            }
+            mount_info = MountInfo(self.mounting_process, mount_point, rc_addr)
+            self.mounted_drives[remote] = mount_info
+            
+            # rclone blocks once the stderr pipe fills up, so keep it drained
+            threading.Thread(
+                target=self._drain_log,
+                args=(mount_info,),
+                daemon=True
+            ).start()
+            
+            # Fill the directory cache in the background so the first listing is fast
+            threading.Thread(
+                target=self._prime_cache,
+                args=(self.mounting_process, rc_addr),
+                daemon=True
+            ).start()
             
             # Return success if process started
             return True
@@ -92,22 +211,131 @@ class RcloneMountManager:
             console.print(f"[bold red]Error mounting drive: {e}[/bold red]")
             return False
 
+    def _detect_existing_mount(self, remote: str, mount_point: str) -> bool:
+        """Check whether mount_point is already a live rclone mount of remote (Linux only)"""
+        # Linux lists mounts in /proc, other systems don't have it
+        try:
+            with open("/proc/self/mountinfo") as mountinfo:
+                lines = mountinfo.readlines()
+        except OSError:
+            return False
+        
+        target = os.path.realpath(mount_point)
+        for line in lines:
+            # Format: id parent major:minor root mount_point options [optional...] - fstype source super_options
+            fields, _, fs_fields = line.partition(" - ")
+            fields, fs_fields = fields.split(), fs_fields.split()
+            if len(fields) < 5 or len(fs_fields) < 2:
+                continue
+            # Spaces and other special characters are octal-escaped, e.g. "\040"
+            path, source = (
+                re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), value)
+                for value in (fields[4], fs_fields[1])
+            )
+            # The source must match exactly, "gdrive:Photos" is not a mount of "gdrive:"
+            if path == target and fs_fields[0] == "fuse.rclone" and source == remote:
+                return self._is_mount_alive(mount_point)
+        return False
+
+    def _is_mount_alive(self, mount_point: str) -> bool:
+        """
+        Check that a mount still answers. When rclone crashes its mount stays listed
+        but fails with "transport endpoint is not connected", so clear it out
+        to let a new rclone mount there
+        """
+        try:
+            os.listdir(mount_point)
+            return True
+        except OSError:
+            try:
+                self._unmount_existing(mount_point)
+            except Exception:
+                pass
+            return False
+
+    def _drain_log(self, mount_info: MountInfo):
+        """Read rclone's log output until it exits, keeping the last line"""
+        for line in mount_info.process.stderr:
+            if line.strip():
+                mount_info.log_tail = line.strip()
+        mount_info.process.stderr.close()
+
+    def get_last_log(self, remote: str) -> str:
+        """Get the last line rclone logged for a drive"""
+        mount_info = self.mounted_drives.get(remote)
+        return mount_info.log_tail if mount_info else ""
+
+    def _find_free_port(self) -> int:
+        """Ask the OS for a free local TCP port"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def _prime_cache(self, process: subprocess.Popen, rc_addr: str):
+        """Ask a running mount to read its whole directory tree into the cache"""
+        for _ in range(PRIME_CACHE_ATTEMPTS):
+            # Wait for the mount to come up and start answering on its rc port
+            time.sleep(1)
+            if process.poll() is not None:
+                return
+            try:
+                subprocess.run(
+                    ["rclone", "rc", "vfs/refresh", "recursive=true", "_async=true",
+                     f"--rc-addr={rc_addr}"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True
+                )
+                return
+            except subprocess.CalledProcessError:
+                continue
+            except FileNotFoundError:
+                return
+
+    def _wait_for_processes(self, processes: List[subprocess.Popen], timeout: float) -> List[subprocess.Popen]:
+        """
+        Wait at most `timeout` seconds in total for the processes to exit,
+        returning the ones that are still running
+        """
+        deadline = time.monotonic() + timeout
+        running = []
+        for process in processes:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                running.append(process)
+        return running
+
+    def _stop_processes(self, remotes: List[str]):
+        """
+        Stop the mount processes of the given drives, asking them to exit cleanly
+        first and only terminating or killing the ones that don't exit in time
+        """
+        processes = [self.mounted_drives[remote].process for remote in remotes]
+        processes = [process for process in processes if process and process.poll() is None]
+        
+        # Signal every process first so they all shut down at the same time
+        for process in processes:
+            process.send_signal(STOP_SIGNAL)
+        processes = self._wait_for_processes(processes, GRACEFUL_STOP_TIMEOUT)
+        
+        for process in processes:
+            process.terminate()
+        processes = self._wait_for_processes(processes, TERMINATE_TIMEOUT)
+        
+        for process in processes:
+            process.kill()
+            process.wait()
+
     def unmount_drive(self, remote: str) -> bool:
         """Unmount a previously mounted drive"""
         if remote in self.mounted_drives:
-            mount_info = self.mounted_drives[remote]
-            
             try:
-                # Kill the mounting process
-                if mount_info["process"] and mount_info["process"].poll() is None:
-                    mount_info["process"].terminate()
-                    mount_info["process"].wait(timeout=5)
-                
-                # On Windows, use "taskkill" to ensure all rclone processes are terminated
-                if os.name == 'nt':
-                    subprocess.run(["taskkill", "/F", "/IM", "rclone.exe"], 
-                                  stdout=subprocess.DEVNULL, 
-                                  stderr=subprocess.DEVNULL)
+                # Stop the mounting process
+                if self.mounted_drives[remote].process is not None:
+                    self._stop_processes([remote])
+                else:
+                    self._unmount_existing(self.mounted_drives[remote].mount_point)
                 
                 # Remove the drive from the mounted_drives dict
                 del self.mounted_drives[remote]
@@ -119,6 +347,41 @@ class RcloneMountManager:
         console.print(f"[bold yellow]Warning: Drive {remote} is not mounted or was already unmounted.[/bold yellow]")
         return False
 
+    def _unmount_existing(self, mount_point: str):
+        """Unmount a drive whose rclone process wasn't started by us"""
+        # fuse3-only systems ship fusermount3, older ones fusermount
+        unmount_cmds = [
+            ["fusermount3", "-u", mount_point],
+            ["fusermount", "-u", mount_point],
+            ["umount", mount_point]
+        ]
+        for unmount_cmd in unmount_cmds:
+            try:
+                subprocess.run(unmount_cmd, check=True)
+                return
+            except FileNotFoundError:
+                continue
+        raise FileNotFoundError("none of fusermount3, fusermount or umount were found")
+
+    def unmount_all_drives(self) -> bool:
+        """
+        Unmount every drive this program started, stopping their processes concurrently.
+        Reused mounts are forgotten but left running, since something else owns them.
+        """
+        remotes = self.get_mounted_drives()
+        
+        try:
+            self._stop_processes(remotes)
+        except Exception as e:
+            console.print(f"[bold red]Error unmounting drives: {e}[/bold red]")
+            return False
+        
+        for remote in remotes:
+            del self.mounted_drives[remote]
+        
+        self.current_mount_name = None
+        return True
+
     def stop_current_mount(self):
         """Stop the current mount process if any"""
         if self.current_mount_name and self.current_mount_name in self.mounted_drives:
@@ -138,32 +401,70 @@ class MountManagerUI:
     def __init__(self):
         self.manager = RcloneMountManager()
         self.console = Console()
+        self._monitor_key = None
+        self._tables: Dict[str, Tuple[object, Table]] = {}
+        
+        # The header and main menu never change, so they are built once
+        self._header = Panel.fit(
+            "[bold blue]Rclone Mount Manager[/bold blue]",
+            subtitle="[italic]Manage your cloud drives easily[/italic]"
+        )
+        self._main_menu = Group(
+            self._header,
+            # Brackets are escaped so Rich doesn't read "[q]" as a markup tag
+            "  \\[1] Mount a cloud drive",
+            "  \\[2] Unmount a cloud drive",
+            "  \\[3] View mounted drives",
+            "  \\[q] Exit program"
+        )
     
     def display_header(self):
         """Display the application header"""
-        self.console.print(Panel.fit(
-            "[bold blue]Rclone Mount Manager[/bold blue]",
-            subtitle="[italic]Manage your cloud drives easily[/italic]"
-        ))
+        self.console.print(self._header)
+    
+    def _build_table(self, name: str, signature: object, build: Callable[[], Table]) -> Table:
+        """Build a table, reusing the previous one with this name if its signature is unchanged"""
+        cached = self._tables.get(name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        table = build()
+        self._tables[name] = (signature, table)
+        return table
+    
+    def _mounted_drives_signature(self) -> Tuple:
+        """Get a value that changes whenever the set of mounts changes"""
+        return tuple(
+            (remote, self.manager.mounted_drives[remote].mount_point)
+            for remote in self.manager.get_mounted_drives()
+        )
     
     def list_remotes(self) -> List[str]:
         """Get and display the list of available remotes"""
-        remotes = self.manager.get_rclone_remotes()
+        remotes_meta = self.manager.get_rclone_remotes_with_meta()
+        remotes = list(remotes_meta)
         
         if not remotes:
             self.console.print("[yellow]No remotes found. Please configure rclone first.[/yellow]")
             return []
         
-        table = Table(title="Available Cloud Drives")
-        table.add_column("Number", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Remote Name", style="green")
-        table.add_column("Status", style="magenta")
-        
-        for i, remote in enumerate(remotes, 1):
-            status = "[green]MOUNTED[/green]" if self.manager.is_drive_mounted(remote) else "[gray]Not Mounted[/gray]"
-            table.add_row(str(i), remote, status)
+        def build() -> Table:
+            table = Table(title="Available Cloud Drives")
+            table.add_column("Number", justify="right", style="cyan", no_wrap=True)
+            table.add_column("Remote Name", style="green")
+            table.add_column("Type", style="blue")
+            table.add_column("Status", style="magenta")
+            
+            for i, remote in enumerate(remotes, 1):
+                status = "[green]MOUNTED[/green]" if self.manager.is_drive_mounted(remote) else "[gray]Not Mounted[/gray]"
+                table.add_row(str(i), remote, remotes_meta[remote]["type"], status)
+            return table
         
-        self.console.print(table)
+        signature = (
+            tuple((remote, meta["type"]) for remote, meta in remotes_meta.items()),
+            frozenset(self.manager.get_mounted_drives())
+        )
+        self.console.print(self._build_table("remotes", signature, build))
         return remotes
 
     def mount_menu(self):
@@ -247,68 +548,95 @@ class MountManagerUI:
     
     def _monitor_mounted_drive(self, remote: str, mount_point: str):
         """Monitor a mounted drive and provide option to unmount"""
-        with Live(refresh_per_second=4) as live:
-            while self.manager.is_drive_mounted(remote):
-                # Create status display
-                status_panel = Panel(
-                    f"[bold green]{remote}[/bold green] is mounted to [bold yellow]{mount_point}[/bold yellow]\n\n"
-                    "[bold cyan]Press 'q' to unmount | Press 'b' to return to menu[/bold cyan]",
-                    title="Drive Monitor",
-                    border_style="green"
-                )
-                
-                live.update(status_panel)
+        mount_info = self.manager.mounted_drives[remote]
+        status_panel = Panel(
+            f"[bold green]{remote}[/bold green] is mounted to [bold yellow]{mount_point}[/bold yellow]\n\n"
+            "[bold cyan]Press 'q' to unmount | Press 'b' to return to menu[/bold cyan]",
+            title="Drive Monitor",
+            border_style="green"
+        )
+        
+        self._monitor_key = None
+        stop_event = threading.Event()
+        
+        if os.name == 'nt':
+            wakeup_r = wakeup_w = None
+        else:
+            # The pipe lets us wake the key reader out of its blocking select
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            wakeup_r, wakeup_w = os.pipe()
+        
+        reader = threading.Thread(
+            target=self._read_monitor_keys,
+            args=(stop_event, wakeup_r),
+            daemon=True
+        )
+        
+        # The panel is static, so it is drawn once and never refreshed
+        with Live(status_panel, console=self.console, auto_refresh=False):
+            try:
+                if os.name != 'nt':
+                    tty.setcbreak(fd)
+                reader.start()
                 
-                # Check for keypress
-                if os.name == 'nt':
-                    # Windows-specific keyboard input
-                    import msvcrt
-                    if msvcrt.kbhit():
-                        key = msvcrt.getch().decode('utf-8').lower()
-                        if key == 'q':
-                            self.manager.unmount_drive(remote)
-                            self.console.print(f"[bold green]{remote} successfully unmounted.[/bold green]")
-                            time.sleep(1)
-                            break
-                        elif key == 'b':
-                            break
+                while not stop_event.is_set() and not mount_info.process_exited():
+                    stop_event.wait(timeout=MONITOR_POLL_INTERVAL)
+            finally:
+                stop_event.set()
+                if os.name != 'nt':
+                    os.write(wakeup_w, b"\0")
+                    if reader.is_alive():
+                        reader.join()
+                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                    os.close(wakeup_r)
+                    os.close(wakeup_w)
+                elif reader.is_alive():
+                    reader.join()
+        
+        if self._monitor_key == 'q':
+            self.manager.unmount_drive(remote)
+            self.console.print(f"[bold green]{remote} successfully unmounted.[/bold green]")
+            time.sleep(1)
+        elif mount_info.process_exited():
+            # rclone exited on its own, so the drive is no longer available
+            last_log = self.manager.get_last_log(remote)
+            self.manager.unmount_drive(remote)
+            self.console.print(f"[bold red]rclone stopped unexpectedly, {remote} is no longer mounted.[/bold red]")
+            if last_log:
+                self.console.print(Text(last_log, style="red"))
+            time.sleep(2)
+    
+    def _read_monitor_keys(self, stop_event: threading.Event, wakeup_fd: Optional[int]):
+        """Wait for 'q' or 'b' to be pressed, then signal the drive monitor"""
+        if os.name == 'nt':
+            # msvcrt has no way to cancel a blocking read, so check for input periodically
+            while not stop_event.is_set():
+                if msvcrt.kbhit():
+                    key = msvcrt.getwch().lower()
+                    if key in ('q', 'b'):
+                        self._monitor_key = key
+                        stop_event.set()
                 else:
-                    # Unix-like keyboard input (simplified version)
-                    import select
-                    import tty
-                    import termios
-                    
-                    fd = sys.stdin.fileno()
-                    old_settings = termios.tcgetattr(fd)
-                    try:
-                        tty.setraw(sys.stdin.fileno())
-                        if select.select([sys.stdin], [], [], 0.5)[0]:
-                            key = sys.stdin.read(1).lower()
-                            if key == 'q':
-                                self.manager.unmount_drive(remote)
-                                self.console.print(f"[bold green]{remote} successfully unmounted.[/bold green]")
-                                time.sleep(1)
-                                break
-                            elif key == 'b':
-                                break
-                    finally:
-                        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-                
-                time.sleep(0.5)
+                    stop_event.wait(0.1)
+        else:
+            fd = sys.stdin.fileno()
+            while not stop_event.is_set():
+                readable = select.select([fd, wakeup_fd], [], [])[0]
+                if fd in readable:
+                    key = os.read(fd, 1).decode(errors="ignore").lower()
+                    if key in ('q', 'b'):
+                        self._monitor_key = key
+                        stop_event.set()
                 
     def _get_available_drive_letters(self) -> List[str]:
         """Get list of available drive letters on Windows"""
         if os.name != 'nt':
             return []
             
-        used_drives = []
-        for letter in range(ord('A'), ord('Z') + 1):
-            drive_letter = chr(letter)
-            if os.path.exists(f"{drive_letter}:"):
-                used_drives.append(drive_letter)
-                
-        available_drives = [chr(letter) for letter in range(ord('A'), ord('Z') + 1) 
-                            if chr(letter) not in used_drives]
+        # One call returns a bitmask of the drive letters in use (bit 0 = A)
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        available_drives = [chr(ord('A') + i) for i in range(26) if not (mask >> i) & 1]
         return available_drives
 
     def unmount_menu(self):
@@ -324,16 +652,18 @@ class MountManagerUI:
             return
             
         # Show table of mounted drives
-        table = Table(title="Currently Mounted Drives")
-        table.add_column("Number", justify="right", style="cyan", no_wrap=True)
-        table.add_column("Remote Name", style="green")
-        table.add_column("Mount Point", style="blue")
-        
-        for i, remote in enumerate(mounted_drives, 1):
-            mount_info = self.manager.mounted_drives[remote]
-            table.add_row(str(i), remote, mount_info["mount_point"])
+        def build() -> Table:
+            table = Table(title="Currently Mounted Drives")
+            table.add_column("Number", justify="right", style="cyan", no_wrap=True)
+            table.add_column("Remote Name", style="green")
+            table.add_column("Mount Point", style="blue")
+            
+            for i, remote in enumerate(mounted_drives, 1):
+                mount_info = self.manager.mounted_drives[remote]
+                table.add_row(str(i), remote, mount_info.mount_point)
+            return table
         
-        self.console.print(table)
+        self.console.print(self._build_table("unmount", self._mounted_drives_signature(), build))
         
         # Provide options
         self.console.print("\n[bold cyan]Options:[/bold cyan]")
@@ -363,19 +693,10 @@ class MountManagerUI:
     def main_menu(self):
         """Display the main menu"""
         while True:
-            self.console.clear()
-            self.display_header()
-            
-            # Show main options
-            options = [
-                "[1] Mount a cloud drive",
-                "[2] Unmount a cloud drive",
-                "[3] View mounted drives",
-                "[q] Exit program"
-            ]
-            
-            for option in options:
-                self.console.print(f"  {option}")
+            # Clear and redraw in a single write to avoid flicker
+            with self.console:
+                self.console.clear()
+                self.console.print(self._main_menu)
                 
             choice = Prompt.ask("\nEnter your choice", choices=["1", "2", "3", "q"])
             
@@ -386,8 +707,7 @@ class MountManagerUI:
             elif choice == "3":
                 self._view_mounted_drives()
             elif choice == "q":
-                # Ensure all drives are unmounted before exit
-                self._cleanup_before_exit()
+                # Drives are unmounted by the atexit handler
                 self.console.print("[bold green]Exiting...[/bold green]")
                 break
     
@@ -400,32 +720,46 @@ class MountManagerUI:
         if not mounted_drives:
             self.console.print("[yellow]No drives are currently mounted.[/yellow]")
         else:
-            table = Table(title="Currently Mounted Drives")
-            table.add_column("Remote Name", style="green")
-            table.add_column("Mount Point", style="blue")
-            
-            for remote in mounted_drives:
-                mount_info = self.manager.mounted_drives[remote]
-                table.add_row(remote, mount_info["mount_point"])
+            def build() -> Table:
+                table = Table(title="Currently Mounted Drives")
+                table.add_column("Remote Name", style="green")
+                table.add_column("Mount Point", style="blue")
+                
+                for remote in mounted_drives:
+                    mount_info = self.manager.mounted_drives[remote]
+                    table.add_row(remote, mount_info.mount_point)
+                return table
             
-            self.console.print(table)
+            self.console.print(self._build_table("mounted", self._mounted_drives_signature(), build))
         
         input("\nPress Enter to continue...")
     
     def _cleanup_before_exit(self):
         """Clean up any mounted drives before exiting"""
-        mounted_drives = self.manager.get_mounted_drives().copy()
+        mounted_drives = self.manager.get_mounted_drives()
         
         if mounted_drives:
-            self.console.print("[yellow]Unmounting drives before exit...[/yellow]")
+            # Mounts that were already in place when we found them are left running
+            existing_count = sum(
+                1 for remote in mounted_drives
+                if self.manager.mounted_drives[remote].process is None
+            )
+            if existing_count < len(mounted_drives):
+                self.console.print("[yellow]Unmounting drives before exit...[/yellow]")
             
-            for remote in mounted_drives:
-                self.manager.unmount_drive(remote)
-                
-            self.console.print("[green]All drives unmounted successfully.[/green]")
+            if not self.manager.unmount_all_drives():
+                self.console.print("[bold red]Some drives could not be unmounted.[/bold red]")
+            elif existing_count == 0:
+                self.console.print("[green]All drives unmounted successfully.[/green]")
+            elif existing_count < len(mounted_drives):
+                self.console.print("[green]Drives mounted by this program unmounted successfully.[/green]")
+            
+            if existing_count:
+                self.console.print(f"[yellow]Left {existing_count} existing mount(s) running.[/yellow]")
 
 # Main entry point
 if __name__ == "__main__":
+    ui = None
     try:
         # Check if rclone is installed
         try:
@@ -440,10 +774,17 @@ if __name__ == "__main__":
             
         # Start the UI
         ui = MountManagerUI()
+        # Unmount drives however the program exits
+        atexit.register(ui._cleanup_before_exit)
+        if os.name != 'nt':
+            # Turn SIGTERM (e.g. from systemctl stop) into a normal exit so atexit runs
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
         ui.main_menu()
     except KeyboardInterrupt:
         console = Console()
         console.print("\n[yellow]Program terminated by user.[/yellow]")
+        if ui is not None:
+            ui._cleanup_before_exit()
         sys.exit(0)
     except Exception as e:
         console = Console()